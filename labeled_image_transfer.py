@@ -1,16 +1,81 @@
 import os
 import csv
+import multiprocessing
+import queue
 import shutil
-import itertools
-import re
-from typing import Iterable, Set, Dict, List, Optional
+import stat
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    AbstractSet, Callable, Iterable, Iterator, Set, Dict, List, Optional, Tuple, Union,
+)
 
 LIKELY_FILENAME_COLUMNS = {"filename"}
 
+# An index entry: a bare path (build_filename_index), or a path with the stat
+# result picked up while scanning (find_matches)
+IndexEntry = Union[str, Tuple[str, Optional[os.stat_result]]]
+
+# Source extensions Roboflow embeds in export names: <stem>_<ext>.rf.<hash>.<ext>
+_RF_SOURCE_EXTS = frozenset({"jpg", "jpeg", "png", "tif", "tiff"})
+
+# Read buffer for annotation CSVs; the 8KB default means a read() per 8KB
+CSV_BUFSIZE = 1024 * 1024
+
+# Buffer size for the userspace fallback copy (shutil's default is 64KB or less)
+COPY_BUFSIZE = 1024 * 1024
+
+# On Linux, os.sendfile can copy between two regular files inside the kernel
+_USE_SENDFILE = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+
+# Files larger than this are copied without going through the system cache,
+# so a batch of multi-hundred-MB TIFFs doesn't evict everything else from it
+UNBUFFERED_COPY_THRESHOLD = 64 * 1024 * 1024
+
+# On Windows 8+, CopyFile2 lets the OS pick the fastest copy strategy
+_CopyFile2 = None
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    _COPY_FILE_NO_BUFFERING = 0x00001000
+
+    class _COPYFILE2_EXTENDED_PARAMETERS(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("dwCopyFlags", wintypes.DWORD),
+            ("pfCancel", ctypes.POINTER(wintypes.BOOL)),
+            ("pProgressRoutine", ctypes.c_void_p),
+            ("pvCallbackContext", ctypes.c_void_p),
+        ]
+
+    try:
+        _CopyFile2 = ctypes.windll.kernel32.CopyFile2
+        _CopyFile2.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p)
+        _CopyFile2.restype = ctypes.c_long  # HRESULT
+    except AttributeError:
+        _CopyFile2 = None
+
+def _last_sep(path: str) -> int:
+    """Index of the last path separator in a path from this OS, or -1."""
+    k = path.rfind(os.sep)
+    if os.altsep:
+        k = max(k, path.rfind(os.altsep))
+    return k
+
+def _name_basename(name: str) -> str:
+    """
+    Basename of a CSV entry. Splits on both '/' and '\\' whatever the OS, since
+    exports may carry paths written on another platform.
+    """
+    return name[max(name.rfind("/"), name.rfind("\\")) + 1:]
+
 def _normalize(name: str, case_insensitive: bool = True) -> str:
-    n = name.strip().strip('"').strip("'")
+    # Whitespace (any Unicode whitespace, e.g. U+00A0), then both quote styles at once
+    n = name.strip().strip("\"'")
     # If the CSV contains paths, drop directories and keep the base filename
-    n = os.path.basename(n)
+    n = _name_basename(n)
     return n.lower() if case_insensitive else n
 
 def _csv_name_to_tif(basename: str) -> str:
@@ -25,14 +90,18 @@ def _csv_name_to_tif(basename: str) -> str:
         before the FIRST occurrence of ".jpg" and use .tif
       - Else, simply swap the file extension to .tif
     """
-    base = os.path.basename(basename)
+    base = _name_basename(basename)
     lower = base.lower()
 
     # Case 1: Roboflow pattern: <stem>_<ext>.rf.<hash>.<ext>
-    m = re.search(r"_(jpg|jpeg|png|tif|tiff)\.rf\.", lower)
-    if m:
-        stem = base[:m.start()]
-        return stem + ".tif"
+    # Plain str.find/rfind rather than a regex: locate ".rf.", then check that
+    # the text between the preceding "_" and it is one of the known extensions.
+    idx = lower.find(".rf.")
+    while idx != -1:
+        us = lower.rfind("_", 0, idx)
+        if us != -1 and lower[us + 1:idx] in _RF_SOURCE_EXTS:
+            return base[:us] + ".tif"
+        idx = lower.find(".rf.", idx + 1)
 
     # Case 2: Split at first ".jpg" if present anywhere
     idx = lower.find(".jpg")
@@ -40,36 +109,55 @@ def _csv_name_to_tif(basename: str) -> str:
         stem = base[:idx]
         return stem + ".tif"
 
-    # Case 3: Generic "replace extension with .tif"
-    stem, _ = os.path.splitext(base)
+    # Case 3: Generic "replace extension with .tif" (a leading dot is not an extension)
+    dot = base.rfind(".")
+    stem = base[:dot] if dot > 0 else base
     return stem + ".tif"
 
 def load_filenames_from_csv(
     csv_path: str,
     column: Optional[str] = None,
     case_insensitive: bool = True,
-) -> Set[str]:
+    dialect: Optional[csv.Dialect] = csv.excel,
+    sniff: bool = False,
+) -> AbstractSet[str]:
     """
-    Load a set of raw CSV filenames (normalized to basename + optional lowercase).
+    Load a set of raw CSV filenames (normalized to basename + optional lowercase),
+    in the order they first appear in the file.
+
+    By default the file is read as `dialect` with a header row, which is what
+    Roboflow exports look like. Pass `sniff=True` to let csv.Sniffer guess the
+    dialect and whether there is a header (slower, for hand-made CSVs).
     """
-    targets: Set[str] = set()
+    # dict used as an insertion-ordered set; keys() is returned
+    targets: Dict[str, None] = {}
+    add = targets.__setitem__
 
-    # Try to sniff header; fall back gracefully
-    with open(csv_path, "r", newline="", encoding="utf-8") as f:
-        sample = f.read(4096)
-        f.seek(0)
-        try:
-            dialect = csv.Sniffer().sniff(sample)
-        except csv.Error:
+    with open(csv_path, "r", newline="", encoding="utf-8", buffering=CSV_BUFSIZE) as f:
+        has_header = True
+        if dialect is None:
             dialect = csv.excel
-        try:
-            has_header = csv.Sniffer().has_header(sample)
-        except csv.Error:
-            has_header = True  # best-effort default
+        if sniff:
+            # Try to sniff header; fall back gracefully
+            sample = f.read(16384)
+            f.seek(0)
+            try:
+                dialect = csv.Sniffer().sniff(sample)
+            except csv.Error:
+                pass
+            try:
+                has_header = csv.Sniffer().has_header(sample)
+            except csv.Error:
+                pass  # best-effort default
 
+        rdr = csv.reader(f, dialect=dialect)
+        col_idx = 0
         if has_header:
-            reader = csv.DictReader(f, dialect=dialect)
-            fieldnames = [fn.strip() for fn in (reader.fieldnames or [])]
+            # Like DictReader, take the first non-empty row as the header
+            header = next(rdr, None)
+            while header == []:
+                header = next(rdr, None)
+            fieldnames = [fn.strip() for fn in (header or [])]
             use_col = None
 
             if column and column in fieldnames:
@@ -85,21 +173,24 @@ def load_filenames_from_csv(
 
             if not use_col:
                 raise ValueError("Could not determine which CSV column contains filenames.")
-
-            for row in reader:
-                raw = row.get(use_col, "") or ""
-                if raw.strip():
-                    targets.add(_normalize(raw, case_insensitive))
-        else:
-            rdr = csv.reader(f, dialect=dialect)
-            for row in rdr:
-                if not row:
-                    continue
-                raw = row[0]
-                if raw.strip():
-                    targets.add(_normalize(raw, case_insensitive))
-
-    return targets
+            col_idx = fieldnames.index(use_col)
+
+        # Plain csv.reader indexed by column: no per-row dict like DictReader builds.
+        # Roboflow writes one row per bounding box with rows for the same image
+        # next to each other, so skip a value identical to the previous row's.
+        last_seen = None
+        for row in rdr:
+            if len(row) <= col_idx:
+                continue
+            raw = row[col_idx]
+            if raw == last_seen:
+                continue
+            last_seen = raw
+            name = _normalize(raw, case_insensitive)
+            if name:
+                add(name, None)
+
+    return targets.keys()
 
 def build_filename_index(
     search_path: str, case_insensitive: bool = True
@@ -107,25 +198,301 @@ def build_filename_index(
     """
     Walk `search_path` once and build a map: normalized_basename -> [full_paths...]
     Supports multiple files with the same basename in different directories.
+
+    Uses an explicit stack over os.scandir rather than os.walk: the DirEntry
+    objects carry the file type from the directory listing, so we avoid a
+    stat() per entry and the per-file os.path.join.
     """
     index: Dict[str, List[str]] = {}
-    for root, _, files in os.walk(search_path):
-        for file in files:
-            key = file.lower() if case_insensitive else file
-            index.setdefault(key, []).append(os.path.join(root, file))
+    stack = [search_path]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            # os.walk silently skips unreadable directories; do the same
+            continue
+        with it:
+            for entry in it:
+                # Same rules as os.walk(followlinks=False): a symlink to a directory
+                # is neither descended into nor listed as a file
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                else:
+                    key = entry.name.lower() if case_insensitive else entry.name
+                    index.setdefault(key, []).append(entry.path)
     return index
 
+def _iter_matches(
+    search_path: str,
+    targets: Set[str],
+    case_insensitive: bool = True,
+    first_match_only: bool = False,
+    skip_dirs: AbstractSet[str] = frozenset(),
+) -> Iterator[Tuple[str, str, str, Optional[os.stat_result]]]:
+    """
+    Walk `search_path` and yield (target, key, full_path, stat_result) for every
+    file whose normalized basename `key` is a target or its .tiff variant, as
+    soon as it is found. See `find_matches` for `first_match_only`; in that mode
+    only an exact `key == target` hit settles a target, while the first .tiff hit
+    per target is still yielded as a provisional fallback.
+    Directories whose absolute, os.path.normcase'd path is in `skip_dirs` are
+    not entered.
+    """
+    lookup: Dict[str, str] = {}
+    for t in targets:
+        lookup[t] = t
+        if t.endswith(".tif"):
+            lookup.setdefault(t + "f", t)
+    remaining = set(lookup.values())
+    tiff_yielded: Set[str] = set()
+    # Cheap pre-filter: most names on the drive can be rejected by length alone,
+    # before paying for lower() and a hash. Only valid for ASCII names, whose
+    # length lower() never changes.
+    lengths = {len(k) for k in lookup}
+
+    if not remaining:
+        return
+
+    # Explicit scandir stack, as in build_filename_index. os.fwalk was tried on
+    # Linux and was no faster: it scandirs the same way, plus an open/stat per
+    # directory for its dir fds.
+    stack = [search_path]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir():
+                    if entry.is_symlink():
+                        continue  # as in build_filename_index
+                    if (
+                        not skip_dirs
+                        or os.path.normcase(os.path.abspath(entry.path)) not in skip_dirs
+                    ):
+                        stack.append(entry.path)
+                    continue
+                name = entry.name
+                if len(name) not in lengths and name.isascii():
+                    continue
+                key = name.lower() if case_insensitive else name
+                target = lookup.get(key)
+                if target is None:
+                    continue
+                if first_match_only:
+                    if target not in remaining:
+                        continue
+                    if key == target:
+                        remaining.discard(target)
+                    elif target in tiff_yielded:
+                        continue
+                    else:
+                        tiff_yielded.add(target)
+                try:
+                    st = entry.stat()
+                except OSError:
+                    st = None
+                yield target, key, entry.path, st
+                if first_match_only and not remaining:
+                    return
+
+def find_matches(
+    search_path: str,
+    targets: Set[str],
+    case_insensitive: bool = True,
+    first_match_only: bool = False,
+    skip_dirs: AbstractSet[str] = frozenset(),
+) -> Dict[str, List[Tuple[str, Optional[os.stat_result]]]]:
+    """
+    Like `build_filename_index`, but only records basenames listed in `targets`
+    (plus their .tiff variant, for the fallback in `copy_files`). Returns
+    normalized_basename -> [(full_path, stat_result), ...], so memory scales with
+    the number of hits rather than with the size of the tree. The stat result
+    comes from the DirEntry (free on Windows) and saves `copy_files` a stat()
+    of the source when copying metadata.
+
+    If `first_match_only=True`, each target is satisfied by the first file found
+    with exactly that name and the walk stops as soon as every target has been
+    located, instead of scanning the whole tree. The first .tiff variant seen is
+    kept too, so `copy_files` can still fall back to it. `skip_dirs` is passed
+    on to `_iter_matches`.
+    """
+    matches: Dict[str, List[Tuple[str, Optional[os.stat_result]]]] = {}
+    for target, key, path, st in _iter_matches(
+        search_path, targets, case_insensitive, first_match_only, skip_dirs
+    ):
+        if first_match_only:
+            # one entry per key; copy_files prefers the .tif key over the .tiff one
+            matches.setdefault(key, [(path, st)])
+        else:
+            matches.setdefault(key, []).append((path, st))
+    return matches
+
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
+def _copy_data(src: str, dst: str) -> None:
+    """
+    Copy file contents only, using sendfile where available and a large
+    buffered read/write loop otherwise.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if _USE_SENDFILE:
+            infd, outfd = fsrc.fileno(), fdst.fileno()
+            size = os.fstat(infd).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(outfd, infd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except OSError:
+                # Some filesystems refuse sendfile; fall back if nothing was written yet
+                if offset:
+                    raise
+        shutil.copyfileobj(fsrc, fdst, COPY_BUFSIZE)
+
+def _check_not_same_file(src: str, dst: str, src_stat: Optional[os.stat_result]) -> None:
+    """
+    Raise shutil.SameFileError if `dst` already exists and is `src`, like
+    shutil.copy2 does; opening `dst` for writing would otherwise truncate the
+    source before any data is copied.
+    """
+    try:
+        dst_stat = os.stat(dst)
+    except OSError:
+        return
+    # DirEntry.stat() leaves st_ino/st_dev at zero on Windows
+    if src_stat is None or not src_stat.st_ino:
+        src_stat = os.stat(src)
+    if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+def _fast_copy(src: str, dst: str, src_stat: Optional[os.stat_result] = None) -> None:
+    """
+    Drop-in replacement for shutil.copy2(src, dst) that uses the platform's
+    fastest copy primitive. Raises OSError on failure.
+
+    `src_stat` is the source's stat result if the caller already has it. It is
+    used to copy the timestamps and mode bits without another stat() of `src`,
+    and on Windows to send files above UNBUFFERED_COPY_THRESHOLD past the
+    system cache.
+    """
+    _check_not_same_file(src, dst, src_stat)
+    if _CopyFile2 is not None:
+        size = (src_stat or os.stat(src)).st_size
+        params = None
+        if size > UNBUFFERED_COPY_THRESHOLD:
+            params = _COPYFILE2_EXTENDED_PARAMETERS()
+            params.dwSize = ctypes.sizeof(params)
+            params.dwCopyFlags = _COPY_FILE_NO_BUFFERING
+            params = ctypes.byref(params)
+        # CopyFile2 also carries over timestamps and attributes
+        if _CopyFile2(src, dst, params) >= 0:
+            return
+        # Let shutil produce a proper exception (or succeed where CopyFile2 couldn't)
+        shutil.copy2(src, dst)
+        return
+
+    _copy_data(src, dst)
+    if src_stat is None:
+        shutil.copystat(src, dst)
+    else:
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+
+def _destination_resolver(
+    destination_path: str,
+    overwrite: bool,
+    keep_dir_structure: bool,
+    search_root_for_structure: Optional[str],
+) -> Callable[[str], str]:
+    """
+    Return a function mapping a source path to its destination path under
+    `destination_path`, creating destination directories as needed. With
+    `overwrite=False`, each call hands out a name not used on disk or by any
+    earlier call (`_1`, `_2`, ... suffixes). Not thread-safe: call it from one
+    thread and let the workers only copy.
+    """
+    ensure_dir(destination_path)
+
+    # Paths are built by string concatenation onto a directory prefix that already
+    # ends in a separator; os.path.join/basename/dirname are too slow per file.
+    def with_sep(path: str) -> str:
+        return path if _last_sep(path) == len(path) - 1 else path + os.sep
+
+    flat_dest = (destination_path, with_sep(destination_path))
+    # source dir -> (dest_dir, dest_dir prefix), when keeping the directory structure
+    structured_dests: Dict[str, Tuple[str, str]] = {}
+
+    # dest_dir -> names present in it, listed once and then extended in memory as
+    # names are handed out, instead of probing with exists(). Both are casefold()ed
+    # on every OS: a case-insensitive volume can be mounted on macOS or Linux too,
+    # and there a case-only clash would overwrite an existing file.
+    taken_names: Dict[str, Set[str]] = {}
+
+    def names_in(dest_dir: str) -> Set[str]:
+        key = dest_dir.casefold()
+        names = taken_names.get(key)
+        if names is None:
+            try:
+                with os.scandir(dest_dir) as it:
+                    names = {e.name.casefold() for e in it}
+            except OSError:
+                names = set()
+            taken_names[key] = names
+        return names
+
+    def resolve(src: str) -> str:
+        k = _last_sep(src)
+        name = src[k + 1:]
+        if keep_dir_structure and search_root_for_structure:
+            dest = structured_dests.get(src[:k])
+            if dest is None:
+                rel_dir = os.path.relpath(os.path.dirname(src), search_root_for_structure)
+                dest_dir = os.path.join(destination_path, rel_dir)
+                ensure_dir(dest_dir)
+                dest = structured_dests[src[:k]] = (dest_dir, with_sep(dest_dir))
+        else:
+            dest = flat_dest
+        dest_dir, dest_prefix = dest
+
+        if not overwrite:
+            taken = names_in(dest_dir)
+            if name.casefold() in taken:
+                base, ext = os.path.splitext(name)
+                i = 1
+                while f"{base}_{i}{ext}".casefold() in taken:
+                    i += 1
+                name = f"{base}_{i}{ext}"
+            taken.add(name.casefold())
+
+        return dest_prefix + name
+
+    return resolve
+
+def _default_copy_workers() -> int:
+    # Copies are I/O bound and release the GIL, so oversubscribe the CPUs
+    return min(32, (os.cpu_count() or 1) * 4)
+
 def copy_files(
     targets: Iterable[str],
-    index: Dict[str, List[str]],
+    index: Dict[str, List[IndexEntry]],
     destination_path: str,
     *,
     overwrite: bool = False,
     keep_dir_structure: bool = False,
     search_root_for_structure: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    verbose: bool = False,
+    log_every: int = 500,
+    not_found: Optional[List[str]] = None,
 ) -> int:
     """
     Copy matching files to `destination_path`.
@@ -133,10 +500,21 @@ def copy_files(
     - If `keep_dir_structure=True`, we replicate each file’s directory tree relative to
       `search_root_for_structure` (you should pass the same path you used to index).
     - If `overwrite=False`, name conflicts get a suffix: `_1`, `_2`, ...
+    - Copies run on a thread pool of `max_workers` threads. Destination names are
+      all chosen up front, so two workers never pick the same `_1` suffix.
+    - Per-file "Copied" lines are only written when `verbose=True`; otherwise a
+      progress line is printed every `log_every` copies. Missing targets are still
+      reported and, if `not_found` is given, appended to it.
     """
-    ensure_dir(destination_path)
-    copied = 0
+    resolve = _destination_resolver(
+        destination_path, overwrite, keep_dir_structure, search_root_for_structure
+    )
 
+    # Pre-pass: resolve every destination path serially. Keyed by the case-folded
+    # dest_path, since "IMG_1.tif" and "img_1.tif" are one file on Windows and macOS;
+    # with overwrite=True a later source replaces an earlier one, as a sequential
+    # copy would.
+    plan: Dict[str, Tuple[str, str, Optional[os.stat_result]]] = {}
     for target in targets:
         # Primary: look for .tif (already lowercased target)
         matches = index.get(target, [])
@@ -147,37 +525,214 @@ def copy_files(
 
         if not matches:
             print(f"Not found: {target}")
+            if not_found is not None:
+                not_found.append(target)
             continue
 
-        for src in matches:
-            if keep_dir_structure and search_root_for_structure:
-                rel_dir = os.path.relpath(os.path.dirname(src), search_root_for_structure)
-                dest_dir = os.path.join(destination_path, rel_dir)
-                ensure_dir(dest_dir)
-                proposed = os.path.join(dest_dir, os.path.basename(src))
-            else:
-                dest_dir = destination_path
-                ensure_dir(dest_dir)
-                proposed = os.path.join(dest_dir, os.path.basename(src))
-
-            dest_path = proposed
-            if not overwrite and os.path.exists(dest_path):
-                base, ext = os.path.splitext(os.path.basename(src))
-                for i in itertools.count(1):
-                    candidate = os.path.join(dest_dir, f"{base}_{i}{ext}")
-                    if not os.path.exists(candidate):
-                        dest_path = candidate
-                        break
+        for match in matches:
+            src, src_stat = match if isinstance(match, tuple) else (match, None)
+            dest_path = resolve(src)
+            key = dest_path.casefold()
+            plan.pop(key, None)
+            plan[key] = (src, dest_path, src_stat)
 
-            try:
-                shutil.copy2(src, dest_path)
-                print(f"Copied '{src}' -> '{dest_path}'")
-                copied += 1
-            except IOError as e:
+    print_lock = threading.Lock()
+
+    def copy_one(item) -> bool:
+        src, dest_path, src_stat = item
+        try:
+            _fast_copy(src, dest_path, src_stat)
+        except IOError as e:
+            with print_lock:
                 print(f"Error copying '{src}': {e}")
+            return False
+        if verbose:
+            with print_lock:
+                sys.stdout.write(f"Copied '{src}' -> '{dest_path}'\n")
+        return True
+
+    if max_workers is None:
+        max_workers = _default_copy_workers()
+
+    total = len(plan)
+    copied = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        for ok in ex.map(copy_one, plan.values()):
+            if ok:
+                copied += 1
+                if not verbose and log_every > 0 and copied % log_every == 0:
+                    with print_lock:
+                        print(f"{copied}/{total}")
+    sys.stdout.flush()
 
     return copied
 
+def _copy_worker(jobs, results) -> None:
+    """
+    Worker process for `copy_matches_pipelined`: copy (src, dest_path, stat) jobs
+    until the None sentinel, reporting (src, dest_path, error_or_None) for each.
+    """
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        src, dest_path, src_stat = job
+        try:
+            _fast_copy(src, dest_path, src_stat)
+        except Exception as e:
+            # Report anything: a worker that dies silently would stall the pipeline
+            results.put((src, dest_path, str(e) if isinstance(e, OSError) else repr(e)))
+        else:
+            results.put((src, dest_path, None))
+
+def copy_matches_pipelined(
+    search_path: str,
+    targets: Set[str],
+    destination_path: str,
+    *,
+    case_insensitive: bool = True,
+    overwrite: bool = False,
+    keep_dir_structure: bool = False,
+    first_match_only: bool = False,
+    processes: Optional[int] = None,
+    verbose: bool = False,
+    log_every: int = 500,
+    not_found: Optional[List[str]] = None,
+) -> int:
+    """
+    Find `targets` under `search_path` and copy them to `destination_path` in one
+    pass: this process walks the tree and queues each match as soon as it is found,
+    while `processes` worker processes copy, so copying starts before the walk ends.
+
+    Destination names are chosen here, as in `copy_files`, so the workers share no
+    state. Differences from `find_matches` + `copy_files`:
+    - .tiff files are queued at the end, for targets that had no .tif match
+    - with overwrite=True, the first source for a destination wins
+    - `destination_path` is always left out of the walk, whereas `find_matches`
+      only skips the `skip_dirs` it is given
+    """
+    search_path = os.path.abspath(search_path)
+    destination_path = os.path.abspath(destination_path)
+    resolve = _destination_resolver(
+        destination_path, overwrite, keep_dir_structure, search_path
+    )
+    if processes is None:
+        processes = min(8, os.cpu_count() or 1)
+
+    jobs = multiprocessing.Queue(maxsize=1024)
+    results = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(target=_copy_worker, args=(jobs, results), daemon=True)
+        for _ in range(processes)
+    ]
+    for w in workers:
+        w.start()
+
+    queued = 0
+    done = 0
+    copied = 0
+    planned: Set[str] = set()
+
+    def handle(result) -> None:
+        nonlocal done, copied
+        src, dest_path, error = result
+        done += 1
+        if error is not None:
+            print(f"Error copying '{src}': {error}")
+            return
+        copied += 1
+        if verbose:
+            sys.stdout.write(f"Copied '{src}' -> '{dest_path}'\n")
+        elif log_every > 0 and copied % log_every == 0:
+            print(f"{copied} copied so far")
+
+    def workers_gone() -> bool:
+        if any(w.is_alive() for w in workers):
+            return False
+        # Nothing will read what is still queued; don't wait on flushing it at exit
+        jobs.cancel_join_thread()
+        return True
+
+    def put_job(job) -> bool:
+        # The queue is bounded; never block forever on it if the workers are gone
+        while True:
+            try:
+                jobs.put(job, timeout=1)
+                return True
+            except queue.Full:
+                if workers_gone():
+                    return False
+
+    def submit(src: str, src_stat: Optional[os.stat_result]) -> None:
+        nonlocal queued
+        dest_path = resolve(src)
+        key = dest_path.casefold()  # as in copy_files
+        if key in planned:
+            return  # only possible with overwrite=True
+        planned.add(key)
+        if not put_job((src, dest_path, src_stat)):
+            raise RuntimeError("All copy worker processes exited unexpectedly")
+        queued += 1
+        # Report whatever has finished without waiting on the workers
+        while True:
+            try:
+                handle(results.get_nowait())
+            except queue.Empty:
+                break
+
+    found: Set[str] = set()
+    pending_tiff: Dict[str, List[Tuple[str, Optional[os.stat_result]]]] = {}
+    try:
+        for target, key, path, st in _iter_matches(
+            search_path,
+            targets,
+            case_insensitive,
+            first_match_only,
+            skip_dirs={os.path.normcase(destination_path)},
+        ):
+            if key == target:
+                found.add(target)
+                pending_tiff.pop(target, None)
+                submit(path, st)
+            elif target not in found:
+                pending_tiff.setdefault(target, []).append((path, st))
+
+        # Graceful fallback: .tiff only for targets with no .tif anywhere
+        for target, matches in pending_tiff.items():
+            found.add(target)
+            for path, st in matches:
+                submit(path, st)
+    finally:
+        for _ in workers:
+            if not put_job(None):
+                break
+        while done < queued:
+            try:
+                handle(results.get(timeout=1))
+            except queue.Empty:
+                if workers_gone():
+                    break
+        for w in workers:
+            w.join()
+        sys.stdout.flush()
+
+    for target in targets:
+        if target not in found:
+            print(f"Not found: {target}")
+            if not_found is not None:
+                not_found.append(target)
+
+    return copied
+
+def _report(copied: int, not_found: List[str], destination_path: str) -> List[str]:
+    if copied:
+        print(f"\n✅ Successfully copied {copied} file(s) to '{destination_path}'.")
+    else:
+        print(f"\n❌ No matching files were found to copy.")
+    if not_found:
+        print(f"{len(not_found)} name(s) from the CSV were not found.")
+    return not_found
+
 def find_and_copy_from_csv(
     csv_path: str,
     search_path: str,
@@ -185,27 +740,71 @@ def find_and_copy_from_csv(
     *,
     column: Optional[str] = None,
     case_insensitive: bool = True,
+    sniff: bool = False,
     overwrite: bool = False,
     keep_dir_structure: bool = False,
-):
+    first_match_only: bool = False,
+    max_workers: Optional[int] = None,
+    verbose: bool = False,
+    log_every: int = 500,
+    pipeline: bool = False,
+    processes: Optional[int] = None,
+) -> List[str]:
     """
     End-to-end: read filenames from CSV, transform each to <stem>.tif,
     find them under `search_path`, and copy to `destination_path`.
+    Returns the .tif names that could not be found.
+
+    Set `first_match_only=True` when each name is unique on disk: the search
+    then stops as soon as every target has been found.
+
+    Set `pipeline=True` to overlap the search with copying, using `processes`
+    worker processes (see `copy_matches_pipelined`); worthwhile for large, slow
+    drives where the walk itself takes a long time.
     """
     print(f"Reading filenames from CSV: {csv_path}")
-    raw_targets = load_filenames_from_csv(csv_path, column=column, case_insensitive=case_insensitive)
+    raw_targets = load_filenames_from_csv(
+        csv_path, column=column, case_insensitive=case_insensitive, sniff=sniff
+    )
     if not raw_targets:
         print("No filenames loaded from CSV — nothing to do.")
-        return
-
-    # Transform CSV names -> .tif basenames
-    tif_targets = set()
-    for t in raw_targets:
-        tif_name = _csv_name_to_tif(t)
-        tif_targets.add(tif_name.lower() if case_insensitive else tif_name)
-
-    print(f"Indexing files under: {search_path}")
-    index = build_filename_index(search_path, case_insensitive=case_insensitive)
+        return []
+
+    # Transform CSV names -> .tif basenames. _csv_name_to_tif keeps the case of
+    # the stem and appends a lowercase ".tif", so names that were lowercased by
+    # load_filenames_from_csv stay lowercase and need no second pass.
+    tif_targets = {_csv_name_to_tif(t) for t in raw_targets}
+    not_found: List[str] = []
+
+    if pipeline:
+        print(
+            f"Searching {search_path} for {len(tif_targets)} .tif name(s) "
+            f"and copying into: {destination_path}"
+        )
+        copied = copy_matches_pipelined(
+            search_path,
+            tif_targets,
+            destination_path,
+            case_insensitive=case_insensitive,
+            overwrite=overwrite,
+            keep_dir_structure=keep_dir_structure,
+            first_match_only=first_match_only,
+            processes=processes,
+            verbose=verbose,
+            log_every=log_every,
+            not_found=not_found,
+        )
+        return _report(copied, not_found, destination_path)
+
+    print(f"Searching files under: {search_path}")
+    index = find_matches(
+        search_path,
+        tif_targets,
+        case_insensitive=case_insensitive,
+        first_match_only=first_match_only,
+        # Don't pick up earlier copies when the destination is inside the search tree
+        skip_dirs={os.path.normcase(os.path.abspath(destination_path))},
+    )
 
     print(f"Will look for {len(tif_targets)} .tif name(s). Copying into: {destination_path}")
     copied = copy_files(
@@ -215,12 +814,12 @@ def find_and_copy_from_csv(
         overwrite=overwrite,
         keep_dir_structure=keep_dir_structure,
         search_root_for_structure=search_path,
+        max_workers=max_workers,
+        verbose=verbose,
+        log_every=log_every,
+        not_found=not_found,
     )
-
-    if copied:
-        print(f"\n✅ Successfully copied {copied} file(s) to '{destination_path}'.")
-    else:
-        print(f"\n❌ No matching files were found to copy.")
+    return _report(copied, not_found, destination_path)
 
 if __name__ == "__main__":
     # Example usage — adjust these paths as needed.
@@ -235,6 +834,10 @@ if __name__ == "__main__":
         destination_path=new_directory,
         column=None,                # or "filename", "path", etc.
         case_insensitive=True,      # set False if you need exact case matching
+        sniff=False,                # set True for CSVs that aren't comma-separated with a header
         overwrite=False,            # set True to overwrite instead of suffixing
         keep_dir_structure=False,   # set True to mirror source folders in destination
+        first_match_only=False,     # set True to stop searching once every name is found
+        verbose=False,              # set True to print every copied file
+        pipeline=False,             # set True to start copying while the search is still running
     )
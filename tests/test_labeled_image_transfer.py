@@ -0,0 +1,428 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Test labeled_image_transfer (CSV-driven search and copy of labeled .tif images)
+"""
+
+import multiprocessing
+import os
+import queue
+import random
+import re
+import shutil
+
+import pytest
+
+import labeled_image_transfer as lit
+
+
+def _write(path, data=b"x"):
+    os.makedirs(os.path.dirname(str(path)), exist_ok=True)
+    with open(str(path), "wb") as f:
+        f.write(data)
+
+
+def _read(path):
+    with open(str(path), "rb") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("first_match_only", [False, True])
+def test_tif_preferred_over_tiff(tmp_path, first_match_only):
+    src = tmp_path / "src"
+    # .tiff sits higher in the tree than the .tif for the same target
+    _write(src / "IMG_1.tiff", b"tiff")
+    _write(src / "sub" / "deeper" / "IMG_1.tif", b"tif")
+    _write(src / "IMG_2.tiff", b"only tiff")
+    dst = tmp_path / "dst"
+
+    index = lit.find_matches(str(src), {"img_1.tif", "img_2.tif"},
+                             first_match_only=first_match_only)
+    not_found = []
+    copied = lit.copy_files(["img_1.tif", "img_2.tif", "img_3.tif"], index, str(dst),
+                            not_found=not_found)
+
+    assert copied == 2
+    assert sorted(os.listdir(str(dst))) == ["IMG_1.tif", "IMG_2.tiff"]
+    assert _read(dst / "IMG_1.tif") == b"tif"
+    assert not_found == ["img_3.tif"]
+
+
+@pytest.mark.parametrize("name, expected", [
+    # Roboflow pattern, for each embedded source extension
+    ("IMG_0001_1_jpg.rf.0123abcd.jpg", "IMG_0001_1.tif"),
+    ("IMG_0001_1_JPEG.rf.0123abcd.jpg", "IMG_0001_1.tif"),
+    ("img_png.rf.x.png", "img.tif"),
+    ("img_tif.RF.x.jpg", "img.tif"),
+    ("img_tiff.rf.x.jpg", "img.tif"),
+    # ".rf." not preceded by a known extension falls through to the ".jpg" split
+    ("img_bmp.rf.x.jpg", "img_bmp.rf.x.tif"),
+    # ".jpg" anywhere: split at its first occurrence
+    ("IMG_0002.jpg", "IMG_0002.tif"),
+    ("IMG_0002.JPG.foo", "IMG_0002.tif"),
+    # generic extension swap
+    ("IMG_0003.png", "IMG_0003.tif"),
+    ("noext", "noext.tif"),
+    (".hidden", ".hidden.tif"),
+    # paths from either platform are reduced to their basename
+    ("a/b\\IMG_0004_jpg.rf.q.jpg", "IMG_0004.tif"),
+])
+def test_csv_name_to_tif(name, expected):
+    assert lit._csv_name_to_tif(name) == expected
+
+
+def _csv_name_to_tif_regex(base):
+    # The regex implementation _csv_name_to_tif replaced
+    lower = base.lower()
+    m = re.search(r"_(jpg|jpeg|png|tif|tiff)\.rf\.", lower)
+    if m:
+        return base[:m.start()] + ".tif"
+    idx = lower.find(".jpg")
+    if idx != -1:
+        return base[:idx] + ".tif"
+    dot = base.rfind(".")
+    return (base[:dot] if dot > 0 else base) + ".tif"
+
+
+def test_csv_name_to_tif_matches_regex_implementation():
+    rng = random.Random(0)
+    parts = ["_", "jpg", "JPEG", "png", ".rf.", ".RF.", "a", "tif", "tiff", ".", "x_y", "bmp",
+             "_jpg.rf."]
+    for _ in range(20000):
+        name = "".join(rng.choices(parts, k=rng.randint(1, 7)))
+        assert lit._csv_name_to_tif(name) == _csv_name_to_tif_regex(name), name
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("  IMG_1.jpg ", "img_1.jpg"),
+    ("\u00a0IMG_1.jpg\u3000", "img_1.jpg"),
+    ('"IMG_1.jpg"', "img_1.jpg"),
+    ("'IMG_1.jpg'", "img_1.jpg"),
+    (" \"'IMG_1.jpg'\"\t", "img_1.jpg"),
+    ("C:\\export\\IMG_1.jpg", "img_1.jpg"),
+    ("export/sub/IMG_1.jpg", "img_1.jpg"),
+])
+def test_normalize(raw, expected):
+    assert lit._normalize(raw) == expected
+    assert lit._normalize(raw, case_insensitive=False) == expected.replace("img", "IMG")
+
+
+def test_load_filenames_skips_repeated_rows(tmp_path):
+    # One row per bounding box, rows for the same image next to each other
+    csv_path = tmp_path / "annotations.csv"
+    csv_path.write_text(
+        "filename,width,height,class\n"
+        "IMG_1_jpg.rf.a.jpg,1,1,x\n"
+        "IMG_1_jpg.rf.a.jpg,1,1,y\n"
+        '"dir/IMG_2.jpg",1,1,x\n'
+        "\n"
+        ",1,1,x\n"
+    )
+    names = lit.load_filenames_from_csv(str(csv_path))
+    assert sorted(names) == ["img_1_jpg.rf.a.jpg", "img_2.jpg"]
+
+
+def test_load_filenames_first_seen_order(tmp_path):
+    csv_path = tmp_path / "annotations.csv"
+    csv_path.write_text(
+        "filename,class\n"
+        "IMG_3.jpg,x\n"
+        "IMG_1.jpg,x\n"
+        "IMG_3.jpg,y\n"
+        "img_1.JPG,z\n"
+        "IMG_2.jpg,x\n"
+    )
+    # Non-adjacent duplicates, including ones differing in case, are dropped too
+    assert list(lit.load_filenames_from_csv(str(csv_path))) == [
+        "img_3.jpg", "img_1.jpg", "img_2.jpg"
+    ]
+
+
+def test_load_filenames_column_selection(tmp_path):
+    csv_path = tmp_path / "annotations.csv"
+    csv_path.write_text(
+        "id, filename ,path\n"
+        "1,IMG_1.jpg,other/IMG_9.jpg\n"
+        "2,IMG_2.jpg\n"
+        "3,IMG_3.jpg,other/IMG_8.jpg\n"
+    )
+    # "likely" column is found even with padding in the header
+    assert list(lit.load_filenames_from_csv(str(csv_path))) == [
+        "img_1.jpg", "img_2.jpg", "img_3.jpg"
+    ]
+    # explicit column wins; short rows are skipped
+    assert list(lit.load_filenames_from_csv(str(csv_path), column="path")) == [
+        "img_9.jpg", "img_8.jpg"
+    ]
+    assert list(
+        lit.load_filenames_from_csv(str(csv_path), column="path", case_insensitive=False)
+    ) == ["IMG_9.jpg", "IMG_8.jpg"]
+
+
+def test_load_filenames_sniffed_without_header(tmp_path):
+    csv_path = tmp_path / "names.csv"
+    csv_path.write_text("IMG_1.jpg;1\nIMG_3.JPG;2\n")
+    assert sorted(lit.load_filenames_from_csv(str(csv_path), sniff=True)) == [
+        "img_1.jpg", "img_3.jpg"
+    ]
+    # Without sniffing, the first row is the header and ";" is not a delimiter
+    assert list(lit.load_filenames_from_csv(str(csv_path))) == ["img_3.jpg;2"]
+
+
+def test_copy_suffixes_against_existing_and_within_run(tmp_path):
+    src = tmp_path / "src"
+    _write(src / "a" / "IMG_1.tif", b"a")
+    _write(src / "b" / "IMG_1.tif", b"b")
+    dst = tmp_path / "dst"
+    _write(dst / "IMG_1.tif", b"old")
+    _write(dst / "IMG_1_1.tif", b"old1")
+
+    index = lit.find_matches(str(src), {"img_1.tif"})
+    copied = lit.copy_files(["img_1.tif"], index, str(dst))
+
+    assert copied == 2
+    assert sorted(os.listdir(str(dst))) == [
+        "IMG_1.tif", "IMG_1_1.tif", "IMG_1_2.tif", "IMG_1_3.tif"
+    ]
+    assert _read(dst / "IMG_1.tif") == b"old"
+    assert _read(dst / "IMG_1_1.tif") == b"old1"
+    assert sorted([_read(dst / "IMG_1_2.tif"), _read(dst / "IMG_1_3.tif")]) == [b"a", b"b"]
+
+
+def test_copy_suffixes_ignore_case(tmp_path):
+    # A name differing only in case is the same file on a case-insensitive volume,
+    # whatever the OS, so it gets a suffix rather than replacing the existing file
+    src = tmp_path / "src"
+    _write(src / "img_1.tif", b"new")
+    dst = tmp_path / "dst"
+    _write(dst / "IMG_1.tif", b"old")
+
+    index = lit.find_matches(str(src), {"img_1.tif"})
+    assert lit.copy_files(["img_1.tif"], index, str(dst)) == 1
+    assert sorted(os.listdir(str(dst))) == ["IMG_1.tif", "img_1_1.tif"]
+    assert _read(dst / "IMG_1.tif") == b"old"
+
+
+def test_copy_keep_dir_structure(tmp_path):
+    src = tmp_path / "src"
+    _write(src / "a" / "IMG_1.tif", b"a")
+    _write(src / "a" / "b" / "IMG_1.tif", b"b")
+    _write(src / "IMG_2.tif", b"2")
+    dst = tmp_path / "dst"
+
+    index = lit.find_matches(str(src), {"img_1.tif", "img_2.tif"})
+    copied = lit.copy_files(["img_1.tif", "img_2.tif"], index, str(dst),
+                            keep_dir_structure=True, search_root_for_structure=str(src))
+
+    assert copied == 3
+    assert _read(dst / "a" / "IMG_1.tif") == b"a"
+    assert _read(dst / "a" / "b" / "IMG_1.tif") == b"b"
+    assert _read(dst / "IMG_2.tif") == b"2"
+
+
+def test_overwrite_rerun_does_not_truncate(tmp_path):
+    # Destination inside the search path, as in the __main__ example: the second
+    # run must neither pick up its own earlier copy nor truncate it
+    src = tmp_path / "src"
+    _write(src / "img1.tif", b"payload")
+    dst = src / "out"
+
+    for _ in range(2):
+        index = lit.find_matches(str(src), {"img1.tif"},
+                                 skip_dirs={os.path.normcase(str(dst))})
+        assert lit.copy_files(["img1.tif"], index, str(dst), overwrite=True) == 1
+        assert _read(dst / "img1.tif") == b"payload"
+
+    # An index that does contain the copy (build_filename_index): copying it
+    # onto itself is reported as an error instead of truncating it
+    index = lit.build_filename_index(str(src))
+    assert lit.copy_files(["img1.tif"], index, str(dst), overwrite=True) == 0
+    assert _read(dst / "img1.tif") == b"payload"
+
+
+@pytest.mark.parametrize("pipeline", [False, True])
+def test_destination_is_ancestor_of_search_path(tmp_path, pipeline):
+    root = tmp_path / "root"
+    _write(root / "flight1" / "IMG_1.tif", b"1")
+    csv_path = tmp_path / "annotations.csv"
+    csv_path.write_text("filename\nIMG_1_jpg.rf.abc.jpg\n")
+
+    not_found = lit.find_and_copy_from_csv(str(csv_path), str(root / "flight1"), str(root),
+                                           pipeline=pipeline)
+
+    assert not_found == []
+    assert _read(root / "IMG_1.tif") == b"1"
+
+
+def test_first_match_inside_destination_without_skip_dirs(tmp_path):
+    src = tmp_path / "src"
+    dst = src / "out"
+    _write(dst / "IMG_1.tif", b"old")
+
+    index = lit.find_matches(str(src), {"img_1.tif"}, first_match_only=True)
+    not_found = []
+    assert lit.copy_files(["img_1.tif"], index, str(dst), not_found=not_found) == 1
+    assert not_found == []
+    assert _read(dst / "IMG_1_1.tif") == b"old"
+
+
+def test_overwrite_several_sources_for_one_destination(tmp_path):
+    src = tmp_path / "src"
+    _write(src / "a" / "IMG_1.tif", b"a")
+    _write(src / "b" / "img_1.tif", b"b")
+    dst = tmp_path / "dst"
+
+    # The names differ only in case, which is one file on case-insensitive volumes
+    index = lit.find_matches(str(src), {"img_1.tif"})
+    assert lit.copy_files(["img_1.tif"], index, str(dst), overwrite=True) == 1
+    assert len(os.listdir(str(dst))) == 1
+    assert _read(dst / os.listdir(str(dst))[0]) == _read(index["img_1.tif"][-1][0])
+
+    shutil.rmtree(str(dst))
+    copied = lit.copy_matches_pipelined(str(src), {"img_1.tif"}, str(dst),
+                                        overwrite=True, processes=2)
+    assert copied == 1
+    assert len(os.listdir(str(dst))) == 1
+
+
+def test_fast_copy_preserves_contents_and_times(tmp_path):
+    src = tmp_path / "big.tif"
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    _write(src, data)
+    os.utime(str(src), (1000000000, 1200000000))
+
+    # with the stat result cached from the walk, and without
+    lit._fast_copy(str(src), str(tmp_path / "a.tif"), os.stat(str(src)))
+    lit._fast_copy(str(src), str(tmp_path / "b.tif"))
+
+    for name in ("a.tif", "b.tif"):
+        assert _read(tmp_path / name) == data
+        assert os.stat(str(tmp_path / name)).st_mtime == os.stat(str(src)).st_mtime
+
+
+def test_fast_copy_same_file(tmp_path):
+    path = tmp_path / "img1.tif"
+    _write(path, b"payload")
+    with pytest.raises(shutil.SameFileError):
+        lit._fast_copy(str(path), str(path), os.stat(str(path)))
+    with pytest.raises(shutil.SameFileError):
+        lit._fast_copy(str(path), str(path))
+    assert _read(path) == b"payload"
+
+
+@pytest.mark.parametrize("first_match_only", [False, True])
+def test_pipelined_destination_inside_search_tree(tmp_path, first_match_only):
+    src = tmp_path / "src"
+    _write(src / "a" / "IMG_1.tif", b"a")
+    _write(src / "IMG_2.tiff", b"tiff")
+    _write(src / "b" / "IMG_2.tif", b"tif")
+    dst = src / "out"
+    _write(dst / "IMG_1.tif", b"old")  # an earlier run's copy
+
+    not_found = []
+    copied = lit.copy_matches_pipelined(
+        str(src), {"img_1.tif", "img_2.tif", "img_3.tif"}, str(dst),
+        first_match_only=first_match_only, processes=2, not_found=not_found,
+    )
+
+    assert copied == 2
+    assert sorted(os.listdir(str(dst))) == ["IMG_1.tif", "IMG_1_1.tif", "IMG_2.tif"]
+    assert _read(dst / "IMG_1.tif") == b"old"
+    assert _read(dst / "IMG_1_1.tif") == b"a"
+    assert _read(dst / "IMG_2.tif") == b"tif"
+    assert not_found == ["img_3.tif"]
+
+
+def test_copy_worker_reports_errors_and_continues(tmp_path, monkeypatch):
+    real_fast_copy = lit._fast_copy
+
+    def fast_copy(src, dest_path, src_stat=None):
+        if src.endswith("bad.tif"):
+            raise ValueError("boom")
+        real_fast_copy(src, dest_path, src_stat)
+
+    monkeypatch.setattr(lit, "_fast_copy", fast_copy)
+    _write(tmp_path / "ok.tif", b"ok")
+    jobs, results = queue.Queue(), queue.Queue()
+    for name in ("bad.tif", "missing.tif", "ok.tif"):
+        jobs.put((str(tmp_path / name), str(tmp_path / ("copy_" + name)), None))
+    jobs.put(None)
+
+    lit._copy_worker(jobs, results)
+
+    reported = [results.get_nowait() for _ in range(3)]
+    assert results.empty()
+    assert reported[0][2] == "ValueError('boom')"
+    assert reported[1][2]  # the OSError message
+    assert reported[2][2] is None
+    assert _read(tmp_path / "copy_ok.tif") == b"ok"
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                    reason="workers must inherit the patched _fast_copy")
+def test_pipelined_worker_error(tmp_path, monkeypatch):
+    def fast_copy(src, dest_path, src_stat=None):
+        raise RuntimeError("no space")
+
+    monkeypatch.setattr(lit, "_fast_copy", fast_copy)
+    _write(tmp_path / "src" / "IMG_1.tif")
+    not_found = []
+    copied = lit.copy_matches_pipelined(str(tmp_path / "src"), {"img_1.tif", "img_2.tif"},
+                                        str(tmp_path / "dst"), processes=2,
+                                        not_found=not_found)
+    assert copied == 0
+    assert not_found == ["img_2.tif"]
+
+
+def _exit_at_once(jobs, results):
+    pass
+
+
+def test_pipelined_workers_exit(tmp_path, monkeypatch):
+    # More matches than the bounded job queue holds, and nobody reading it
+    targets = set()
+    for i in range(1100):
+        _write(tmp_path / "src" / f"IMG_{i}.tif")
+        targets.add(f"img_{i}.tif")
+    monkeypatch.setattr(lit, "_copy_worker", _exit_at_once)
+
+    with pytest.raises(RuntimeError, match="exited unexpectedly"):
+        lit.copy_matches_pipelined(str(tmp_path / "src"), targets, str(tmp_path / "dst"),
+                                   processes=2)
+
+
+def test_find_and_copy_from_csv_end_to_end(tmp_path):
+    src = tmp_path / "src"
+    _write(src / "flight1" / "IMG_0001_1.tif", b"1")
+    _write(src / "flight1" / "IMG_0002_1.tif", b"2")
+    csv_path = tmp_path / "annotations.csv"
+    csv_path.write_text(
+        "filename,class\n"
+        "IMG_0001_1_jpg.rf.abc.jpg,x\n"
+        "IMG_0001_1_jpg.rf.abc.jpg,y\n"
+        "IMG_0009_1_jpg.rf.def.jpg,x\n"
+    )
+    dst = src / "Labeled Tif Images"
+
+    for pipeline in (False, True):
+        not_found = lit.find_and_copy_from_csv(str(csv_path), str(src), str(dst),
+                                               overwrite=True, pipeline=pipeline)
+        assert not_found == ["img_0009_1.tif"]
+        assert os.listdir(str(dst)) == ["IMG_0001_1.tif"]
+        assert _read(dst / "IMG_0001_1.tif") == b"1"
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink") or os.name == "nt", reason="needs POSIX symlinks")
+def test_directory_symlinks_are_not_files_or_followed(tmp_path):
+    src = tmp_path / "src"
+    _write(src / "real" / "IMG_1.tif", b"a")
+    _write(tmp_path / "elsewhere" / "IMG_2.tif", b"b")
+    # a directory symlink named like a target, and one pointing out of the tree
+    os.symlink(str(src / "real"), str(src / "IMG_3.tif"))
+    os.symlink(str(tmp_path / "elsewhere"), str(src / "link"))
+
+    index = lit.build_filename_index(str(src))
+    assert sorted(index) == ["img_1.tif"]
+
+    matches = lit.find_matches(str(src), {"img_1.tif", "img_2.tif", "img_3.tif"})
+    assert sorted(matches) == ["img_1.tif"]